@@ -4,16 +4,24 @@
  * These are NOT full implementations, only the pieces needed by unit tests.
  */
 
+import { load } from "js-yaml";
+
 export class App {}
 
 export class TAbstractFile {
     path = "";
     name = "";
+    parent: TFolder | null = null;
 }
 
-export class TFile extends TAbstractFile {}
+export class TFile extends TAbstractFile {
+    basename = "";
+    extension = "";
+}
 
-export class TFolder extends TAbstractFile {}
+export class TFolder extends TAbstractFile {
+    children: TAbstractFile[] = [];
+}
 
 export class Vault {
     getAbstractFileByPath(_path: string): TAbstractFile | null {
@@ -66,3 +74,11 @@ export async function requestUrl(_request: string | RequestUrlParam): Promise<Re
     };
 }
 
+
+/**
+ * Obsidian parses frontmatter with a real YAML parser; delegate to js-yaml so
+ * tests see genuine YAML behaviour (quoting, flow lists, syntax errors).
+ */
+export function parseYaml(text: string): any {
+    return load(text);
+}
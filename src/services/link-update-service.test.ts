@@ -0,0 +1,92 @@
+import { describe, expect, it } from "vitest";
+import { TAbstractFile, TFile, TFolder, Vault } from "obsidian";
+import { LinkUpdateService } from "./link-update-service";
+
+const REPORTS = "Nexus/Reports";
+const ARTIFACTS = "Nexus/Attachments/claude/artifacts";
+
+function file(path: string): TFile {
+    const f = new TFile();
+    f.path = path;
+    f.name = path.split("/").pop() || path;
+    f.extension = f.name.split(".").pop() || "";
+    return f;
+}
+
+function folder(path: string, children: TAbstractFile[]): TFolder {
+    const f = new TFolder();
+    f.path = path;
+    f.name = path.split("/").pop() || path;
+    f.children = children;
+    children.forEach(child => { child.parent = f; });
+    return f;
+}
+
+/**
+ * A service over an in-memory vault holding one report and one Claude artifact note
+ */
+function serviceWith(report: string, artifact: string) {
+    const contents: Record<string, string> = {
+        [`${REPORTS}/report.md`]: report,
+        [`${ARTIFACTS}/My Chat/script_v1.md`]: artifact,
+    };
+    const folders = [
+        folder(REPORTS, [file(`${REPORTS}/report.md`)]),
+        folder(ARTIFACTS, [folder(`${ARTIFACTS}/My Chat`, [file(`${ARTIFACTS}/My Chat/script_v1.md`)])]),
+    ];
+
+    const vault = new Vault();
+    vault.getAbstractFileByPath = (path: string) => folders.find(f => f.path === path) ?? null;
+    Object.assign(vault, {
+        read: async (f: TFile) => contents[f.path],
+        modify: async (f: TFile, data: string) => { contents[f.path] = data; },
+    });
+
+    const plugin = {
+        app: { vault },
+        settings: { reportFolder: REPORTS, attachmentFolder: "Nexus/Attachments", conversationFolder: "Nexus/Conversations" },
+        logger: { error: () => {}, warn: () => {}, info: () => {}, debug: () => {} },
+    };
+
+    return {
+        service: new LinkUpdateService(plugin as any),
+        report: () => contents[`${REPORTS}/report.md`],
+        artifact: () => contents[`${ARTIFACTS}/My Chat/script_v1.md`],
+    };
+}
+
+describe("LinkUpdateService.updateConversationLinks", () => {
+    const artifactNote = (folderPath: string) => [
+        "---",
+        `conversation_link: "[[${folderPath}/claude/My Chat|My Chat]]"`,
+        "---",
+        `**Conversation:** [[${folderPath}/claude/My Chat]]`,
+    ].join("\n");
+
+    it("rewrites report links, artifact frontmatter links and artifact body links", async () => {
+        const { service, report, artifact } = serviceWith(
+            "- [[Nexus/Conversations/claude/My Chat|My Chat]]\n- [[Nexus/Conversations/claude/Other]]\n- [[Nexus/Conversations-old/claude/Kept]]",
+            artifactNote("Nexus/Conversations")
+        );
+
+        const stats = await service.updateConversationLinks("Nexus/Conversations/", "Archive/Chats/");
+
+        expect(report()).toBe("- [[Archive/Chats/claude/My Chat|My Chat]]\n- [[Archive/Chats/claude/Other]]\n- [[Nexus/Conversations-old/claude/Kept]]");
+        expect(artifact()).toBe(artifactNote("Archive/Chats"));
+        expect(stats.conversationLinksUpdated).toBe(4);
+        expect(stats.filesModified).toBe(2);
+    });
+
+    it("rewrites each link once when the new path starts with the old one", async () => {
+        const { service, report, artifact } = serviceWith(
+            "[[Nexus/Conversations/claude/My Chat|My Chat]] [[Nexus/Conversations/claude/Other]]",
+            artifactNote("Nexus/Conversations")
+        );
+
+        const stats = await service.updateConversationLinks("Nexus/Conversations", "Nexus/Conversations/Archive");
+
+        expect(report()).toBe("[[Nexus/Conversations/Archive/claude/My Chat|My Chat]] [[Nexus/Conversations/Archive/claude/Other]]");
+        expect(artifact()).toBe(artifactNote("Nexus/Conversations/Archive"));
+        expect(stats.conversationLinksUpdated).toBe(4);
+    });
+});
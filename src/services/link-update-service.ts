@@ -22,6 +22,12 @@ import { TFile } from "obsidian";
 import { logger } from "../logger";
 import type NexusAiChatImporterPlugin from "../main";
 import { UpgradeProgressModal } from "../upgrade/utils/progress-modal";
+import { updatePluginVersion } from "../utils/frontmatter-utils";
+import { LinkRewriter } from "../utils/link-rewriter";
+import { getConversationNoteFiles, getMarkdownFilesInFolder } from "../utils/vault-files";
+
+const TRAILING_SLASHES_REGEX = /\/+$/;
+const REGEXP_SPECIAL_CHARS_REGEX = /[.*+?^${}()|[\]\\]/g;
 
 export interface LinkUpdateStats {
     conversationsScanned: number;
@@ -71,36 +77,21 @@ export class LinkUpdateService {
                 detail: `Found ${conversationFiles.length} conversations to scan`
             });
 
-            // Process conversations in batches
-            const batchSize = 10;
-            for (let i = 0; i < conversationFiles.length; i += batchSize) {
-                const batch = conversationFiles.slice(i, i + batchSize);
+            // Compile the link matcher once for the whole run, not per file
+            const rewriter = new LinkRewriter([{ oldPath: oldAttachmentPath, newPath: newAttachmentPath }]);
 
-                progressCallback?.({
+            // Process conversations in batches
+            await this.processFilesInBatches(conversationFiles, stats, {
+                batchSize: 10,
+                linkCounter: 'attachmentLinksUpdated',
+                errorContext: 'attachment links',
+                onBatch: (processed) => progressCallback?.({
                     phase: 'updating-attachments',
-                    current: i,
+                    current: processed,
                     total: conversationFiles.length,
-                    detail: `Updating attachment links: ${i}/${conversationFiles.length} files processed`
-                });
-
-                for (const file of batch) {
-                    try {
-                        const result = await this.updateAttachmentLinksInFile(file, oldAttachmentPath, newAttachmentPath);
-                        stats.attachmentLinksUpdated += result.linksUpdated;
-                        if (result.fileModified) {
-                            stats.filesModified++;
-                        }
-                    } catch (error) {
-                        stats.errors++;
-                        this.plugin.logger.error(`Error updating attachment links in ${file.path}:`, error);
-                    }
-                }
-
-                // Small delay between batches to prevent UI blocking
-                if (i + batchSize < conversationFiles.length) {
-                    await new Promise(resolve => setTimeout(resolve, 10));
-                }
-            }
+                    detail: `Updating attachment links: ${processed}/${conversationFiles.length} files processed`
+                })
+            }, (file) => this.rewriteAttachmentLinksInFile(file, rewriter));
 
             progressCallback?.({
                 phase: 'complete',
@@ -154,74 +145,44 @@ export class LinkUpdateService {
                 detail: `Found ${reportFiles.length} reports and ${artifactFiles.length} artifacts to scan`
             });
 
-            // Process reports in batches
+            // Compile the link patterns once for the whole run, not once per file
+            const reportPatterns = [
+                // Obsidian links, with or without alias: [[path/...]] / [[path/...|title]]
+                this.compileFolderLinkPattern('(\\[\\[)', oldConversationPath, '(/[^\\]]+\\]\\])')
+            ];
+            const artifactPatterns = [
+                // conversation_link in frontmatter: "[[oldPath/...]]" or "[[oldPath/...|alias]]"
+                this.compileFolderLinkPattern('(conversation_link:\\s*"\\[\\[)', oldConversationPath, '(/[^\\]]+\\]\\]")'),
+                // **Conversation:** link in body, with or without alias
+                this.compileFolderLinkPattern('(\\*\\*Conversation:\\*\\*\\s*\\[\\[)', oldConversationPath, '(/[^\\]]+\\]\\])')
+            ];
+
+            // Process reports, then Claude artifacts, in batches
             const batchSize = 5; // Smaller batches for reports since they're typically fewer
-            let processedCount = 0;
-
-            for (let i = 0; i < reportFiles.length; i += batchSize) {
-                const batch = reportFiles.slice(i, i + batchSize);
 
-                progressCallback?.({
+            await this.processFilesInBatches(reportFiles, stats, {
+                batchSize,
+                linkCounter: 'conversationLinksUpdated',
+                errorContext: 'conversation links',
+                onBatch: (processed) => progressCallback?.({
                     phase: 'updating-conversations',
-                    current: processedCount,
+                    current: processed,
                     total: totalFiles,
-                    detail: `Updating conversation links in reports: ${i}/${reportFiles.length} processed`
-                });
-
-                for (const file of batch) {
-                    try {
-                        const result = await this.updateConversationLinksInFile(file, oldConversationPath, newConversationPath);
-                        stats.conversationLinksUpdated += result.linksUpdated;
-                        if (result.fileModified) {
-                            stats.filesModified++;
-                        }
-                    } catch (error) {
-                        stats.errors++;
-                        this.plugin.logger.error(`Error updating conversation links in ${file.path}:`, error);
-                    }
-                }
-
-                processedCount += batch.length;
-
-                // Small delay between batches
-                if (i + batchSize < reportFiles.length) {
-                    await new Promise(resolve => setTimeout(resolve, 10));
-                }
-            }
-
-            // Process Claude artifacts in batches
-            for (let i = 0; i < artifactFiles.length; i += batchSize) {
-                const batch = artifactFiles.slice(i, i + batchSize);
-
-                progressCallback?.({
+                    detail: `Updating conversation links in reports: ${processed}/${reportFiles.length} processed`
+                })
+            }, (file) => this.replaceFolderLinksInFile(file, reportPatterns, newConversationPath));
+
+            await this.processFilesInBatches(artifactFiles, stats, {
+                batchSize,
+                linkCounter: 'conversationLinksUpdated',
+                errorContext: 'conversation link in artifact',
+                onBatch: (processed) => progressCallback?.({
                     phase: 'updating-artifacts',
-                    current: processedCount,
+                    current: reportFiles.length + processed,
                     total: totalFiles,
-                    detail: `Updating conversation links in artifacts: ${i}/${artifactFiles.length} processed`
-                });
-
-                for (const file of batch) {
-                    try {
-                        const result = await this.updateConversationLinkInArtifactFrontmatter(file, oldConversationPath, newConversationPath);
-                        if (result.linksUpdated > 0) {
-                            stats.conversationLinksUpdated += result.linksUpdated;
-                        }
-                        if (result.fileModified) {
-                            stats.filesModified++;
-                        }
-                    } catch (error) {
-                        stats.errors++;
-                        this.plugin.logger.error(`Error updating conversation link in artifact ${file.path}:`, error);
-                    }
-                }
-
-                processedCount += batch.length;
-
-                // Small delay between batches
-                if (i + batchSize < artifactFiles.length) {
-                    await new Promise(resolve => setTimeout(resolve, 10));
-                }
-            }
+                    detail: `Updating conversation links in artifacts: ${processed}/${artifactFiles.length} processed`
+                })
+            }, (file) => this.replaceFolderLinksInFile(file, artifactPatterns, newConversationPath));
 
             progressCallback?.({
                 phase: 'complete',
@@ -278,73 +239,26 @@ export class LinkUpdateService {
                 detail: `Checking links: ${pathMappings.length} path(s) across ${conversationFiles.length} file(s)`
             });
 
-            // Pre-build regex patterns for all mappings
-            const mappingPatterns = pathMappings.map(({oldPath, newPath}) => {
-                const normalizedOld = oldPath.replace(/\/+$/, '');
-                const normalizedNew = newPath.replace(/\/+$/, '');
-                const escaped = this.escapeRegExp(normalizedOld);
-                return {
-                    patterns: [
-                        { regex: new RegExp(`(!\\[[^\\]]*\\]\\()${escaped}(/[^)]+\\))`, 'g'), replacement: `$1${normalizedNew}$2` },
-                        { regex: new RegExp(`(\\[[^\\]]*\\]\\()${escaped}(/[^)]+\\))`, 'g'), replacement: `$1${normalizedNew}$2` },
-                        { regex: new RegExp(`(!\\[\\[)${escaped}(/[^\\]]+\\]\\])`, 'g'), replacement: `$1${normalizedNew}$2` },
-                        { regex: new RegExp(`(\\[\\[)${escaped}(/[^\\]]+\\]\\])`, 'g'), replacement: `$1${normalizedNew}$2` },
-                    ]
-                };
-            });
+            // Build the multi-mapping rewriter once; each file is then scanned a single time
+            const rewriter = new LinkRewriter(pathMappings);
 
             // Single pass through all files
             const batchSize = 10;
-            for (let i = 0; i < conversationFiles.length; i += batchSize) {
-                const batch = conversationFiles.slice(i, i + batchSize);
-
-                if (i % 50 === 0 || i + batchSize >= conversationFiles.length) {
-                    progressCallback?.({
-                        phase: 'updating-attachments',
-                        current: i,
-                        total: conversationFiles.length,
-                        detail: `Checking links: ${i}/${conversationFiles.length} files`
-                    });
-                }
-
-                for (const file of batch) {
-                    try {
-                        const content = await this.plugin.app.vault.read(file);
-                        let updatedContent = content;
-                        let fileLinksUpdated = 0;
-
-                        for (const mapping of mappingPatterns) {
-                            for (const {regex, replacement} of mapping.patterns) {
-                                regex.lastIndex = 0;
-                                const before = updatedContent;
-                                updatedContent = updatedContent.replace(regex, replacement);
-                                if (updatedContent !== before) {
-                                    regex.lastIndex = 0;
-                                    const matches = before.match(regex);
-                                    fileLinksUpdated += matches ? matches.length : 1;
-                                }
-                            }
-                        }
-
-                        stats.attachmentLinksUpdated += fileLinksUpdated;
-                        if (content !== updatedContent) {
-                            // Update plugin_version in frontmatter if requested
-                            if (pluginVersion) {
-                                updatedContent = this.updatePluginVersion(updatedContent, pluginVersion);
-                            }
-                            await this.plugin.app.vault.modify(file, updatedContent);
-                            stats.filesModified++;
-                        }
-                    } catch (error) {
-                        stats.errors++;
-                        this.plugin.logger.error(`Error updating attachment links in ${file.path}:`, error);
+            await this.processFilesInBatches(conversationFiles, stats, {
+                batchSize,
+                linkCounter: 'attachmentLinksUpdated',
+                errorContext: 'attachment links',
+                onBatch: (processed) => {
+                    if (processed % 50 === 0 || processed + batchSize >= conversationFiles.length) {
+                        progressCallback?.({
+                            phase: 'updating-attachments',
+                            current: processed,
+                            total: conversationFiles.length,
+                            detail: `Checking links: ${processed}/${conversationFiles.length} files`
+                        });
                     }
                 }
-
-                if (i + batchSize < conversationFiles.length) {
-                    await new Promise(resolve => setTimeout(resolve, 10));
-                }
-            }
+            }, (file) => this.rewriteAttachmentLinksInFile(file, rewriter, pluginVersion));
 
             progressCallback?.({
                 phase: 'complete',
@@ -381,36 +295,61 @@ export class LinkUpdateService {
     }
 
     /**
-     * Get all conversation files from the vault
+     * Shared batch loop for all link updates: files of a batch are updated concurrently,
+     * per-file errors are counted without aborting the run, and the UI gets a short
+     * break between batches.
      */
-    private async getConversationFiles(): Promise<TFile[]> {
-        const conversationFolder = this.plugin.settings.conversationFolder;
-        const allFiles = this.plugin.app.vault.getMarkdownFiles();
-
-        return allFiles.filter(file => {
-            if (!file.path.startsWith(conversationFolder)) return false;
-
-            // Exclude Reports and Attachments folders
-            const relativePath = file.path.substring(conversationFolder.length + 1);
-            if (relativePath.startsWith('Reports/') ||
-                relativePath.startsWith('Attachments/') ||
-                relativePath.startsWith('reports/') ||
-                relativePath.startsWith('attachments/')) {
-                return false;
+    private async processFilesInBatches(
+        files: TFile[],
+        stats: LinkUpdateStats,
+        options: {
+            batchSize: number;
+            linkCounter: 'attachmentLinksUpdated' | 'conversationLinksUpdated';
+            errorContext: string;
+            onBatch?: (processed: number) => void;
+        },
+        updateFile: (file: TFile) => Promise<{ linksUpdated: number; fileModified: boolean }>
+    ): Promise<void> {
+        const { batchSize, linkCounter, errorContext, onBatch } = options;
+
+        for (let i = 0; i < files.length; i += batchSize) {
+            const batch = files.slice(i, i + batchSize);
+            onBatch?.(i);
+
+            // Files in a batch are independent: overlap their vault reads/writes
+            await Promise.all(batch.map(async (file) => {
+                try {
+                    const result = await updateFile(file);
+                    stats[linkCounter] += result.linksUpdated;
+                    if (result.fileModified) {
+                        stats.filesModified++;
+                    }
+                } catch (error) {
+                    stats.errors++;
+                    this.plugin.logger.error(`Error updating ${errorContext} in ${file.path}:`, error);
+                }
+            }));
+
+            // Small delay between batches to prevent UI blocking
+            if (i + batchSize < files.length) {
+                await new Promise(resolve => setTimeout(resolve, 10));
             }
+        }
+    }
 
-            return true;
-        });
+    /**
+     * Get all conversation files from the vault
+     */
+    private async getConversationFiles(): Promise<TFile[]> {
+        // Excludes Reports and Attachments folders directly under the conversation folder
+        return getConversationNoteFiles(this.plugin.app.vault, this.plugin.settings.conversationFolder);
     }
 
     /**
      * Get all report files from the vault
      */
     private async getReportFiles(): Promise<TFile[]> {
-        const reportFolder = this.plugin.settings.reportFolder;
-        const allFiles = this.plugin.app.vault.getMarkdownFiles();
-
-        return allFiles.filter(file => file.path.startsWith(reportFolder));
+        return getMarkdownFilesInFolder(this.plugin.app.vault, this.plugin.settings.reportFolder);
     }
 
     /**
@@ -418,162 +357,62 @@ export class LinkUpdateService {
      */
     private async getClaudeArtifactFiles(): Promise<TFile[]> {
         const attachmentFolder = this.plugin.settings.attachmentFolder;
-        const claudeArtifactsPath = `${attachmentFolder}/claude/artifacts`;
-        const allFiles = this.plugin.app.vault.getMarkdownFiles();
-
-        return allFiles.filter(file => file.path.startsWith(claudeArtifactsPath));
+        return getMarkdownFilesInFolder(this.plugin.app.vault, `${attachmentFolder}/claude/artifacts`);
     }
 
     /**
-     * Update attachment links in a single file
+     * Rewrite attachment links of a single file with a prebuilt rewriter,
+     * optionally bumping plugin_version when the file changes
      */
-    private async updateAttachmentLinksInFile(
+    private async rewriteAttachmentLinksInFile(
         file: TFile,
-        oldAttachmentPath: string,
-        newAttachmentPath: string
+        rewriter: LinkRewriter,
+        pluginVersion?: string
     ): Promise<{ linksUpdated: number; fileModified: boolean }> {
         const content = await this.plugin.app.vault.read(file);
-        let updatedContent = content;
-        let linksUpdated = 0;
-
-        // Normalize paths: remove trailing slashes for consistent matching
-        const normalizedOldPath = oldAttachmentPath.replace(/\/+$/, '');
-        const normalizedNewPath = newAttachmentPath.replace(/\/+$/, '');
-
-        // Escape special regex characters in paths
-        const escapedOldPath = this.escapeRegExp(normalizedOldPath);
-
-        // Pattern 1: Markdown image links ![alt](path/...)
-        // Matches: ![alt](oldPath/subpath/file.png)
-        const imagePattern = new RegExp(`(!\\[[^\\]]*\\]\\()${escapedOldPath}(/[^)]+\\))`, 'g');
-        updatedContent = updatedContent.replace(imagePattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${suffix}`;
-        });
-
-        // Pattern 2: Markdown file links [text](path/...)
-        // Matches: [text](oldPath/subpath/file.pdf)
-        const linkPattern = new RegExp(`(\\[[^\\]]*\\]\\()${escapedOldPath}(/[^)]+\\))`, 'g');
-        updatedContent = updatedContent.replace(linkPattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${suffix}`;
-        });
-
-        // Pattern 3: Obsidian image embeds ![[path/...]]
-        // Matches: ![[oldPath/subpath/file.png]]
-        const obsidianImagePattern = new RegExp(`(!\\[\\[)${escapedOldPath}(/[^\\]]+\\]\\])`, 'g');
-        updatedContent = updatedContent.replace(obsidianImagePattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${suffix}`;
-        });
-
-        // Pattern 4: Obsidian file links [[path/...]]
-        // Matches: [[oldPath/subpath/file.md]]
-        const obsidianLinkPattern = new RegExp(`(\\[\\[)${escapedOldPath}(/[^\\]]+\\]\\])`, 'g');
-        updatedContent = updatedContent.replace(obsidianLinkPattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${suffix}`;
-        });
-
-        const fileModified = content !== updatedContent;
-        if (fileModified) {
-            await this.plugin.app.vault.modify(file, updatedContent);
+        const result = rewriter.rewrite(content);
+        if (result.linksUpdated === 0) {
+            return { linksUpdated: 0, fileModified: false };
         }
 
-        return { linksUpdated, fileModified };
+        // Update plugin_version in frontmatter if requested
+        const updatedContent = pluginVersion
+            ? updatePluginVersion(result.content, pluginVersion)
+            : result.content;
+        await this.plugin.app.vault.modify(file, updatedContent);
+        return { linksUpdated: result.linksUpdated, fileModified: true };
     }
 
     /**
-     * Update conversation links in a single report file
+     * Build a global pattern matching "<prefix group><old folder path><suffix group>"
      */
-    private async updateConversationLinksInFile(
-        file: TFile,
-        oldConversationPath: string,
-        newConversationPath: string
-    ): Promise<{ linksUpdated: number; fileModified: boolean }> {
-        const content = await this.plugin.app.vault.read(file);
-        let updatedContent = content;
-        let linksUpdated = 0;
-
-        // Normalize paths: remove trailing slashes for consistent matching
-        const normalizedOldPath = oldConversationPath.replace(/\/+$/, '');
-        const normalizedNewPath = newConversationPath.replace(/\/+$/, '');
-
-        // Escape special regex characters in paths
-        const escapedOldPath = this.escapeRegExp(normalizedOldPath);
-
-        // Pattern: Obsidian links with aliases [[path/...|title]]
-        const linkWithAliasPattern = new RegExp(`(\\[\\[)${escapedOldPath}(/[^|\\]]+)(\\|[^\\]]+\\]\\])`, 'g');
-        updatedContent = updatedContent.replace(linkWithAliasPattern, (match, prefix, pathSuffix, aliasSuffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${pathSuffix}${aliasSuffix}`;
-        });
-
-        // Pattern: Simple Obsidian links [[path/...]]
-        const simpleLinkPattern = new RegExp(`(\\[\\[)${escapedOldPath}(/[^\\]]+\\]\\])`, 'g');
-        updatedContent = updatedContent.replace(simpleLinkPattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${suffix}`;
-        });
-
-        const fileModified = content !== updatedContent;
-        if (fileModified) {
-            await this.plugin.app.vault.modify(file, updatedContent);
-        }
-
-        return { linksUpdated, fileModified };
+    private compileFolderLinkPattern(prefixSource: string, oldPath: string, suffixSource: string): RegExp {
+        const escapedOldPath = this.escapeRegExp(oldPath.replace(TRAILING_SLASHES_REGEX, ''));
+        return new RegExp(`${prefixSource}${escapedOldPath}${suffixSource}`, 'g');
     }
 
     /**
-     * Update conversation links in Claude artifact (both frontmatter and body)
+     * Replace the old folder path with the new one in every match of the precompiled patterns
      */
-    private async updateConversationLinkInArtifactFrontmatter(
+    private async replaceFolderLinksInFile(
         file: TFile,
-        oldConversationPath: string,
-        newConversationPath: string
+        patterns: RegExp[],
+        newPath: string
     ): Promise<{ linksUpdated: number; fileModified: boolean }> {
         const content = await this.plugin.app.vault.read(file);
+        const normalizedNewPath = newPath.replace(TRAILING_SLASHES_REGEX, '');
         let updatedContent = content;
         let linksUpdated = 0;
 
-        // Normalize paths: remove trailing slashes for consistent matching
-        const normalizedOldPath = oldConversationPath.replace(/\/+$/, '');
-        const normalizedNewPath = newConversationPath.replace(/\/+$/, '');
-
-        // Escape special regex characters in paths
-        const escapedOldPath = this.escapeRegExp(normalizedOldPath);
-
-        // Pattern 1: conversation_link in frontmatter: "[[oldPath/...]]" or "[[oldPath/...|alias]]"
-        const frontmatterLinkPattern = new RegExp(
-            `(conversation_link:\\s*"\\[\\[)${escapedOldPath}(/[^\\]]+)(\\]\\]")`,
-            'g'
-        );
-        updatedContent = updatedContent.replace(frontmatterLinkPattern, (match, prefix, pathSuffix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${pathSuffix}${suffix}`;
-        });
-
-        // Pattern 2: **Conversation:** link in body with alias [[path/...|title]]
-        const bodyLinkWithAliasPattern = new RegExp(
-            `(\\*\\*Conversation:\\*\\*\\s*\\[\\[)${escapedOldPath}(/[^|\\]]+)(\\|[^\\]]+\\]\\])`,
-            'g'
-        );
-        updatedContent = updatedContent.replace(bodyLinkWithAliasPattern, (match, prefix, pathSuffix, aliasSuffix) => {
-            linksUpdated++;
-            return `${prefix}${normalizedNewPath}${pathSuffix}${aliasSuffix}`;
-        });
-
-        // Pattern 3: **Conversation:** link in body without alias [[path]]
-        const bodyLinkSimplePattern = new RegExp(
-            `(\\*\\*Conversation:\\*\\*\\s*\\[\\[)${escapedOldPath}(/[^\\]]+\\]\\])`,
-            'g'
-        );
-        updatedContent = updatedContent.replace(bodyLinkSimplePattern, (match, prefix, suffix) => {
-            linksUpdated++;
-            return `${prefix}${newConversationPath}${suffix}`;
-        });
-
-        const fileModified = content !== updatedContent;
+        for (const pattern of patterns) {
+            pattern.lastIndex = 0;
+            updatedContent = updatedContent.replace(pattern, (match, prefix: string, suffix: string) => {
+                linksUpdated++;
+                return `${prefix}${normalizedNewPath}${suffix}`;
+            });
+        }
+
+        const fileModified = linksUpdated > 0;
         if (fileModified) {
             await this.plugin.app.vault.modify(file, updatedContent);
         }
@@ -581,27 +420,10 @@ export class LinkUpdateService {
         return { linksUpdated, fileModified };
     }
 
-    /**
-     * Update plugin_version in frontmatter
-     */
-    private updatePluginVersion(content: string, version: string): string {
-        if (content.includes('plugin_version:')) {
-            return content.replace(
-                /^plugin_version: .*$/m,
-                `plugin_version: "${version}"`
-            );
-        }
-        // Add plugin_version before the closing --- of frontmatter
-        return content.replace(
-            /\n---\n/,
-            `\nplugin_version: "${version}"\n---\n`
-        );
-    }
-
     /**
      * Escape special regex characters
      */
     private escapeRegExp(string: string): string {
-        return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+        return string.replace(REGEXP_SPECIAL_CHARS_REGEX, '\\$&');
     }
 }
@@ -22,6 +22,7 @@ import { ConversationCatalogEntry } from "../types/plugin";
 import { TFile } from "obsidian";
 import type NexusAiChatImporterPlugin from "../main";
 import { DateParser } from "../utils/date-parser";
+import { getConversationNoteFiles } from "../utils/vault-files";
 
 export class StorageService {
     private importedArchives: Record<string, { fileName: string; date: string }> = {};
@@ -133,22 +134,8 @@ export class StorageService {
                                   this.plugin.settings.archiveFolder ||
                                   "Nexus/Conversations";
 
-        const allFiles = this.plugin.app.vault.getMarkdownFiles();
-
-        // Filter conversation files (exclude Reports/Attachments)
-        const conversationFiles = allFiles.filter(file => {
-            if (!file.path.startsWith(conversationFolder)) return false;
-
-            const relativePath = file.path.substring(conversationFolder.length + 1);
-            if (relativePath.startsWith('Reports/') ||
-                relativePath.startsWith('Attachments/') ||
-                relativePath.startsWith('reports/') ||
-                relativePath.startsWith('attachments/')) {
-                return false;
-            }
-
-            return true;
-        });
+        // Walk the conversation folder only, skipping Reports/Attachments directly under it
+        const conversationFiles = getConversationNoteFiles(this.plugin.app.vault, conversationFolder);
 
         let processed = 0;
         let foundViaCache = 0;
@@ -157,7 +144,6 @@ export class StorageService {
 
         storageLogger.debug("Conversation files discovered for scan", {
             conversationFolder,
-            markdownFileCount: allFiles.length,
             conversationFileCount: conversationFiles.length,
         });
 
@@ -166,28 +152,38 @@ export class StorageService {
         for (let i = 0; i < conversationFiles.length; i += batchSize) {
             const batch = conversationFiles.slice(i, i + batchSize);
 
-            for (const file of batch) {
-                processed++;
-
+            // Parse the batch concurrently: cache hits resolve immediately and
+            // the manual fallback reads overlap instead of running one by one
+            const results = await Promise.all(batch.map(async (file) => {
                 try {
                     // Try metadataCache first (fast)
-                    let entry = await this.parseWithCache(file);
-                    if (entry) {
-                        conversations.set(entry.conversationId, entry);
-                        foundViaCache++;
-                        continue;
+                    const cached = await this.parseWithCache(file);
+                    if (cached) {
+                        return { entry: cached, viaCache: true };
                     }
 
                     // Fallback to manual parsing
-                    entry = await this.parseConversationFileManually(file);
-                    if (entry) {
-                        conversations.set(entry.conversationId, entry);
-                        foundViaManual++;
-                    }
+                    const manual = await this.parseConversationFileManually(file);
+                    return manual ? { entry: manual, viaCache: false } : null;
 
                 } catch (error) {
                     errors++;
                     this.plugin.logger.warn(`Error parsing conversation file ${file.path}:`, error);
+                    return null;
+                }
+            }));
+
+            // Insert in walk order, as sequential parsing would: for a duplicate
+            // conversation ID the last note in the (stable) folder walk wins
+            for (const result of results) {
+                processed++;
+                if (!result) continue;
+
+                conversations.set(result.entry.conversationId, result.entry);
+                if (result.viaCache) {
+                    foundViaCache++;
+                } else {
+                    foundViaManual++;
                 }
             }
 
@@ -21,6 +21,7 @@
 import { Notice } from "obsidian";
 import { VersionUpgrade, UpgradeContext } from "./upgrade-interface";
 import { VersionUtils } from "./utils/version-utils";
+import { ensureUpgradeHistory, operationKey } from "./utils/upgrade-history";
 import { showDialog } from "../dialogs";
 import { Logger } from "../logger";
 import { GITHUB } from "../config/constants";
@@ -284,12 +285,17 @@ export class IncrementalUpgradeManager {
                 const context = await this.createUpgradeContext(upgrade, fromVersion, toVersion);
 
                 // Execute automatic operations with progress updates
-                const automaticResults = await this.executeOperationsWithProgress(
-                    upgrade.automaticOperations,
-                    context,
-                    upgrade.version,
-                    progressModal
-                );
+                let automaticResults;
+                try {
+                    automaticResults = await this.executeOperationsWithProgress(
+                        upgrade.automaticOperations,
+                        context,
+                        upgrade.version,
+                        progressModal
+                    );
+                } finally {
+                    upgrade.releaseRunState();
+                }
 
 
                 // Manual operations will be handled separately if any exist
@@ -497,17 +503,9 @@ export class IncrementalUpgradeManager {
     private async markUpgradeComplete(version: string): Promise<void> {
         const data = await this.plugin.loadData() || {};
 
-        // Initialize upgrade history structure if needed
-        if (!data.upgradeHistory) {
-            data.upgradeHistory = {
-                completedUpgrades: {},
-                completedOperations: {}
-            };
-        }
-
         // Mark upgrade as completed in structured format
         const versionKey = version.replace(/\./g, '_');
-        data.upgradeHistory.completedUpgrades[versionKey] = {
+        ensureUpgradeHistory(data).completedUpgrades[versionKey] = {
             version: version,
             date: new Date().toISOString(),
             completed: true
@@ -772,8 +770,7 @@ export class IncrementalUpgradeManager {
      */
     private async isOperationCompleted(operationId: string, version: string): Promise<boolean> {
         const data = await this.plugin.loadData();
-        const operationKey = `operation_${version.replace(/\./g, '_')}_${operationId}`;
-        return data?.upgradeHistory?.completedOperations?.[operationKey]?.completed || false;
+        return data?.upgradeHistory?.completedOperations?.[operationKey(version, operationId)]?.completed || false;
     }
 
     /**
@@ -782,17 +779,8 @@ export class IncrementalUpgradeManager {
     private async markOperationCompleted(operationId: string, version: string): Promise<void> {
         const data = await this.plugin.loadData() || {};
 
-        // Initialize upgrade history structure if needed
-        if (!data.upgradeHistory) {
-            data.upgradeHistory = {
-                completedUpgrades: {},
-                completedOperations: {}
-            };
-        }
-
         // Mark operation as completed in structured format
-        const operationKey = `operation_${version.replace(/\./g, '_')}_${operationId}`;
-        data.upgradeHistory.completedOperations[operationKey] = {
+        ensureUpgradeHistory(data).completedOperations[operationKey(version, operationId)] = {
             operationId: operationId,
             version: version,
             date: new Date().toISOString(),
@@ -20,6 +20,7 @@
 // src/upgrade/upgrade-interface.ts
 import type NexusAiChatImporterPlugin from "../main";
 import { VersionUtils } from "./utils/version-utils";
+import { ensureUpgradeHistory, operationKey } from "./utils/upgrade-history";
 import { showDialog } from "../dialogs";
 import { Logger } from "../logger";
 
@@ -80,6 +81,14 @@ export abstract class VersionUpgrade {
                VersionUtils.compareVersions(fromVersion, this.version) < 0;
     }
 
+    /**
+     * Release state shared between the operations of one upgrade run.
+     * Called once after the automatic operations ran, whether or not they succeeded.
+     */
+    releaseRunState(): void {
+        // Nothing shared by default
+    }
+
     /**
      * Execute all automatic operations
      */
@@ -132,6 +141,9 @@ export abstract class VersionUpgrade {
             }
         }
 
+        // Each operation catches its own errors, so this always runs
+        this.releaseRunState();
+
         return { success: allSuccess, results };
     }
 
@@ -262,8 +274,7 @@ export abstract class VersionUpgrade {
      */
     private async isOperationCompleted(operationId: string, context: UpgradeContext): Promise<boolean> {
         const data = await context.plugin.loadData();
-        const operationKey = `operation_${this.version.replace(/\./g, '_')}_${operationId}`;
-        return data?.upgradeHistory?.completedOperations?.[operationKey]?.completed || false;
+        return data?.upgradeHistory?.completedOperations?.[operationKey(this.version, operationId)]?.completed || false;
     }
 
     /**
@@ -271,18 +282,9 @@ export abstract class VersionUpgrade {
      */
     private async markOperationCompleted(operationId: string, context: UpgradeContext): Promise<void> {
         const data = await context.plugin.loadData() || {};
-        
-        // Initialize upgrade history structure if needed
-        if (!data.upgradeHistory) {
-            data.upgradeHistory = {
-                completedUpgrades: {},
-                completedOperations: {}
-            };
-        }
-        
+
         // Mark operation as completed in structured format
-        const operationKey = `operation_${this.version.replace(/\./g, '_')}_${operationId}`;
-        data.upgradeHistory.completedOperations[operationKey] = {
+        ensureUpgradeHistory(data).completedOperations[operationKey(this.version, operationId)] = {
             operationId: operationId,
             version: this.version,
             date: new Date().toISOString(),
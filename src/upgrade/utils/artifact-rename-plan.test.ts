@@ -0,0 +1,82 @@
+import { describe, expect, it } from "vitest";
+import { TAbstractFile, TFolder } from "obsidian";
+import type { ConversationCatalogEntry } from "../../types/plugin";
+import { planArtifactFolderRenames } from "./artifact-rename-plan";
+
+const ARTIFACTS = "Nexus/Attachments/claude/artifacts";
+const ID_A = "a3663666-58a8-4835-bef1-308fb59c8609";
+const ID_B = "0f1e2d3c-4b5a-6978-8899-aabbccddeeff";
+const ID_C = "11111111-2222-3333-4444-555555555555";
+
+function folder(path: string, children: TAbstractFile[] = []): TFolder {
+    const f = new TFolder();
+    f.path = path;
+    f.name = path.split("/").pop() || path;
+    f.children = children;
+    return f;
+}
+
+function catalog(entries: Record<string, string>): Map<string, ConversationCatalogEntry> {
+    return new Map(Object.entries(entries).map(([conversationId, path]) => [conversationId, {
+        conversationId, provider: "claude", path, updateTime: 0, create_time: 0, update_time: 0
+    }]));
+}
+
+describe("planArtifactFolderRenames", () => {
+    it("plans a rename to the conversation file name", () => {
+        const uuidFolder = folder(`${ARTIFACTS}/${ID_A}`);
+        const root = folder(ARTIFACTS, [uuidFolder]);
+
+        const plan = planArtifactFolderRenames(root, [uuidFolder], catalog({
+            [ID_A]: "Nexus/Conversations/claude/2026/02/My Chat.md",
+        }));
+
+        expect(plan.skipped).toEqual([]);
+        expect(plan.renames).toEqual([{
+            folder: uuidFolder,
+            conversationId: ID_A,
+            targetName: "My Chat",
+            targetPath: `${ARTIFACTS}/My Chat`,
+        }]);
+    });
+
+    it("skips folders whose conversation is not in the catalog", () => {
+        const uuidFolder = folder(`${ARTIFACTS}/${ID_A}`);
+
+        const plan = planArtifactFolderRenames(folder(ARTIFACTS, [uuidFolder]), [uuidFolder], catalog({}));
+
+        expect(plan.renames).toEqual([]);
+        expect(plan.skipped).toEqual([`Skipped: ${ID_A} (conversation not found in vault)`]);
+    });
+
+    it("skips folders whose target already exists", () => {
+        const uuidFolder = folder(`${ARTIFACTS}/${ID_A}`);
+        const root = folder(ARTIFACTS, [uuidFolder, folder(`${ARTIFACTS}/My Chat`)]);
+
+        const plan = planArtifactFolderRenames(root, [uuidFolder], catalog({
+            [ID_A]: "Nexus/Conversations/claude/My Chat.md",
+        }));
+
+        expect(plan.renames).toEqual([]);
+        expect(plan.skipped).toEqual([`Skipped: ${ID_A} → "My Chat" (target folder already exists)`]);
+    });
+
+    it("reports folders resolving to the same target as a conflict", () => {
+        const folderA = folder(`${ARTIFACTS}/${ID_A}`);
+        const folderB = folder(`${ARTIFACTS}/${ID_B}`);
+        const folderC = folder(`${ARTIFACTS}/${ID_C}`);
+        const root = folder(ARTIFACTS, [folderA, folderB, folderC]);
+
+        const plan = planArtifactFolderRenames(root, [folderA, folderB, folderC], catalog({
+            [ID_A]: "Nexus/Conversations/claude/2026/01/Same Title.md",
+            [ID_B]: "Nexus/Conversations/claude/2026/02/Same Title.md",
+            [ID_C]: "Nexus/Conversations/claude/2026/02/Other.md",
+        }));
+
+        expect(plan.renames.map(r => [r.conversationId, r.targetName])).toEqual([
+            [ID_A, "Same Title"],
+            [ID_C, "Other"],
+        ]);
+        expect(plan.skipped).toEqual([`Skipped: ${ID_B} → "Same Title" (same target as ${ID_A})`]);
+    });
+});
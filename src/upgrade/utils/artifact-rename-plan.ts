@@ -0,0 +1,97 @@
+/**
+ * Nexus AI Chat Importer - Obsidian Plugin
+ * Copyright (C) 2024 Akim Sissaoui
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+// src/upgrade/utils/artifact-rename-plan.ts
+import type { TFolder } from "obsidian";
+import type { ConversationCatalogEntry } from "../../types/plugin";
+
+/**
+ * A planned rename of one UUID artifact folder to its conversation file name
+ */
+export interface ArtifactFolderRenamePlan {
+    folder: TFolder;
+    conversationId: string;
+    targetName: string;
+    targetPath: string;
+}
+
+/**
+ * Decide the target name of every UUID artifact folder without touching the vault.
+ * Folders whose target already exists, or is claimed by another folder of this
+ * run (two conversations exported with the same file name), are skipped.
+ *
+ * @returns the renames to execute, in folder order, and one detail line per skipped folder
+ */
+export function planArtifactFolderRenames(
+    artifactsFolder: TFolder,
+    uuidFolders: TFolder[],
+    conversationMap: Map<string, ConversationCatalogEntry>
+): { renames: ArtifactFolderRenamePlan[]; skipped: string[] } {
+    const renames: ArtifactFolderRenamePlan[] = [];
+    const skipped: string[] = [];
+
+    // Names already present in the artifacts folder, checked in memory instead of
+    // querying the vault for every candidate target
+    const existingNames = new Set(artifactsFolder.children.map(child => child.name));
+    const claimedBy = new Map<string, string>();
+
+    for (const folder of uuidFolders) {
+        const conversationId = folder.name;
+
+        // Look up conversation file path from pre-built map
+        const entry = conversationMap.get(conversationId) || null;
+
+        if (!entry || !entry.path) {
+            skipped.push(`Skipped: ${conversationId} (conversation not found in vault)`);
+            continue;
+        }
+
+        // Extract filename from path (e.g. "Nexus/Conversations/claude/2026/02/My Chat.md" → "My Chat")
+        const fileNameWithExt = entry.path.substring(entry.path.lastIndexOf('/') + 1);
+        const targetName = fileNameWithExt.endsWith('.md')
+            ? fileNameWithExt.slice(0, -3)
+            : fileNameWithExt;
+
+        if (!targetName) {
+            skipped.push(`Skipped: ${conversationId} (could not determine file name)`);
+            continue;
+        }
+
+        if (existingNames.has(targetName)) {
+            skipped.push(`Skipped: ${conversationId} → "${targetName}" (target folder already exists)`);
+            continue;
+        }
+
+        const claimingId = claimedBy.get(targetName);
+        if (claimingId) {
+            skipped.push(`Skipped: ${conversationId} → "${targetName}" (same target as ${claimingId})`);
+            continue;
+        }
+
+        claimedBy.set(targetName, conversationId);
+        renames.push({
+            folder,
+            conversationId,
+            targetName,
+            targetPath: `${artifactsFolder.path}/${targetName}`
+        });
+    }
+
+    return { renames, skipped };
+}
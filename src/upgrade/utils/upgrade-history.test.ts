@@ -0,0 +1,50 @@
+import { describe, expect, it } from "vitest";
+import { loadScanCheckpoint, saveScanCheckpoint, type PluginDataStore } from "./upgrade-history";
+
+function memoryStore(initial: any = null): PluginDataStore & { data: any } {
+    return {
+        data: initial,
+        async loadData() {
+            return this.data === null ? null : JSON.parse(JSON.stringify(this.data));
+        },
+        async saveData(data: any) {
+            this.data = JSON.parse(JSON.stringify(data));
+        }
+    };
+}
+
+describe("scan checkpoints", () => {
+    it("starts empty when nothing was saved", async () => {
+        expect(await loadScanCheckpoint(memoryStore(), "1.4.0", "fix-callout-empty-lines")).toEqual({});
+    });
+
+    it("round-trips a checkpoint and initializes the upgrade history", async () => {
+        const store = memoryStore({ settings: { conversationFolder: "Nexus/Conversations" } });
+
+        await saveScanCheckpoint(store, "1.4.0", "fix-callout-empty-lines", { "a.md": 1, "b.md": 2 });
+
+        expect(await loadScanCheckpoint(store, "1.4.0", "fix-callout-empty-lines")).toEqual({ "a.md": 1, "b.md": 2 });
+        expect(store.data.settings).toEqual({ conversationFolder: "Nexus/Conversations" });
+        expect(store.data.upgradeHistory.completedOperations).toEqual({});
+        expect(store.data.upgradeHistory.scanCheckpoints).toHaveProperty("operation_1_4_0_fix-callout-empty-lines");
+    });
+
+    it("keeps checkpoints of different operations apart", async () => {
+        const store = memoryStore();
+
+        await saveScanCheckpoint(store, "1.4.0", "first", { "a.md": 1 });
+        await saveScanCheckpoint(store, "1.4.0", "second", { "b.md": 2 });
+
+        expect(await loadScanCheckpoint(store, "1.4.0", "first")).toEqual({ "a.md": 1 });
+        expect(await loadScanCheckpoint(store, "1.4.0", "second")).toEqual({ "b.md": 2 });
+    });
+
+    it("drops the checkpoint once the operation succeeded", async () => {
+        const store = memoryStore();
+        await saveScanCheckpoint(store, "1.4.0", "fix-callout-empty-lines", { "a.md": 1 });
+
+        await saveScanCheckpoint(store, "1.4.0", "fix-callout-empty-lines", null);
+
+        expect(await loadScanCheckpoint(store, "1.4.0", "fix-callout-empty-lines")).toEqual({});
+    });
+});
@@ -0,0 +1,90 @@
+/**
+ * Nexus AI Chat Importer - Obsidian Plugin
+ * Copyright (C) 2024 Akim Sissaoui
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+// src/upgrade/utils/upgrade-history.ts
+
+/**
+ * Plugin data access needed to read and write the upgrade history
+ */
+export interface PluginDataStore {
+    loadData(): Promise<any>;
+    saveData(data: any): Promise<void>;
+}
+
+/**
+ * Path → mtime of files an operation already checked
+ */
+export type ScanCheckpoint = Record<string, number>;
+
+/**
+ * Upgrade history key of an operation, shared by completion records and checkpoints
+ */
+export function operationKey(version: string, operationId: string): string {
+    return `operation_${version.replace(/\./g, '_')}_${operationId}`;
+}
+
+/**
+ * Initialize the upgrade history structure of plugin data if needed
+ */
+export function ensureUpgradeHistory(data: any): any {
+    if (!data.upgradeHistory) {
+        data.upgradeHistory = {
+            completedUpgrades: {},
+            completedOperations: {}
+        };
+    }
+    return data.upgradeHistory;
+}
+
+/**
+ * Load the checkpoint left by an earlier, interrupted or failed run of an operation.
+ * Files listed with an unchanged mtime were already checked and can be skipped without reading.
+ */
+export async function loadScanCheckpoint(store: PluginDataStore, version: string, operationId: string): Promise<ScanCheckpoint> {
+    const data = await store.loadData();
+    return { ...(data?.upgradeHistory?.scanCheckpoints?.[operationKey(version, operationId)] || {}) };
+}
+
+/**
+ * Persist the checkpoint of a running operation, or drop it (null) once the operation succeeded.
+ */
+export async function saveScanCheckpoint(
+    store: PluginDataStore,
+    version: string,
+    operationId: string,
+    checkpoint: ScanCheckpoint | null
+): Promise<void> {
+    const data = await store.loadData() || {};
+    const key = operationKey(version, operationId);
+
+    if (!checkpoint) {
+        if (!data.upgradeHistory?.scanCheckpoints?.[key]) {
+            return;
+        }
+        delete data.upgradeHistory.scanCheckpoints[key];
+    } else {
+        const history = ensureUpgradeHistory(data);
+        if (!history.scanCheckpoints) {
+            history.scanCheckpoints = {};
+        }
+        history.scanCheckpoints[key] = { ...checkpoint };
+    }
+
+    await store.saveData(data);
+}
@@ -22,6 +22,11 @@ import { VersionUpgrade, UpgradeOperation, UpgradeContext, OperationResult } fro
 import { TFile, TFolder } from "obsidian";
 import { StorageService } from "../../services/storage-service";
 import { LinkUpdateService } from "../../services/link-update-service";
+import type { ConversationCatalogEntry } from "../../types/plugin";
+import { getMarkdownFilesInFolder } from "../../utils/vault-files";
+import { parseFrontmatterLenient, updatePluginVersion } from "../../utils/frontmatter-utils";
+import { loadScanCheckpoint, saveScanCheckpoint } from "../utils/upgrade-history";
+import { planArtifactFolderRenames } from "../utils/artifact-rename-plan";
 
 /**
  * UUID pattern: 8-4-4-4-12 hex chars (e.g. "a3663666-58a8-4835-bef1-308fb59c8609")
@@ -31,21 +36,54 @@ const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12
 const TARGET_VERSION = "1.4.0";
 
 /**
- * Update plugin_version in frontmatter to the target version.
- * Handles both existing and missing plugin_version fields.
+ * Artifact fields still recovered when the note's frontmatter is malformed YAML.
+ * The title (aliases) is not: it then falls back to the artifact id.
  */
-function updatePluginVersion(content: string, version: string): string {
-    if (content.includes('plugin_version:')) {
-        return content.replace(
-            /^plugin_version: .*$/m,
-            `plugin_version: "${version}"`
-        );
+const ARTIFACT_SCALAR_FIELDS = ['conversation_id', 'artifact_id', 'version_number'];
+
+/** Minimum time between checkpoint saves of a running scan */
+const CHECKPOINT_SAVE_INTERVAL_MS = 30000;
+
+/**
+ * Conversation catalog shared by the operations of one 1.4.0 upgrade run.
+ * Renaming and restoring both need the conversationId → note lookup; the vault
+ * is scanned once and the result handed over instead of parsing every
+ * conversation frontmatter twice. Artifact folder renames do not move notes,
+ * so the catalog stays valid between the two operations.
+ *
+ * Upgrade140 releases it at the end of each run, so a later run never sees a
+ * stale catalog even when one of the consumers was skipped.
+ */
+class SharedConversationCatalog {
+    private pending: Promise<Map<string, ConversationCatalogEntry>> | null = null;
+
+    get(context: UpgradeContext): Promise<Map<string, ConversationCatalogEntry>> {
+        if (!this.pending) {
+            const storageService = new StorageService(context.plugin);
+            this.pending = storageService.scanExistingConversations().catch(error => {
+                this.pending = null;
+                throw error;
+            });
+        }
+        return this.pending;
+    }
+
+    /**
+     * Drop the cached catalog
+     */
+    release(): void {
+        this.pending = null;
     }
-    // Add plugin_version before the closing --- of frontmatter
-    return content.replace(
-        /\n---\n/,
-        `\nplugin_version: "${version}"\n---\n`
-    );
+}
+
+/**
+ * Parsed fields of a Claude artifact note used to rebuild callouts
+ */
+interface ArtifactRecord {
+    conversationId: string | null;
+    artifactId: string;
+    versionNumber: number;
+    title: string;
 }
 
 /**
@@ -61,6 +99,10 @@ class RenameClaudeArtifactFoldersOperation extends UpgradeOperation {
     readonly description = "Renames Claude artifact folders from UUID to human-readable names matching the conversation file.";
     readonly type = "automatic" as const;
 
+    constructor(private readonly catalog: SharedConversationCatalog) {
+        super();
+    }
+
     async canRun(context: UpgradeContext): Promise<boolean> {
         try {
             const attachmentFolder = context.plugin.settings.attachmentFolder || "Nexus/Attachments";
@@ -118,61 +160,33 @@ class RenameClaudeArtifactFoldersOperation extends UpgradeOperation {
                 };
             }
 
-            // Build conversation lookup ONCE (avoid repeated full vault scans)
+            // Build conversation lookup ONCE (shared with the restore operation)
             context.onProgress?.(0, "Scanning conversation catalog...");
-            const storageService = new StorageService(context.plugin);
-            const conversationMap = await storageService.scanExistingConversations();
+            const conversationMap = await this.catalog.get(context);
+
+            // Phase 1: plan every rename and report conflicts before anything is moved
+            const plan = planArtifactFolderRenames(artifactsFolder, uuidFolders, conversationMap);
+            skippedCount += plan.skipped.length;
+            details.push(...plan.skipped);
 
-            const total = uuidFolders.length;
+            const total = plan.renames.length;
             const pathMappings: Array<{oldPath: string, newPath: string}> = [];
 
-            for (let i = 0; i < uuidFolders.length; i++) {
-                const folder = uuidFolders[i];
-                const conversationId = folder.name;
+            // Phase 2: execute. Renames stay sequential: each vault.rename() may trigger
+            // Obsidian's own link updater
+            for (let i = 0; i < plan.renames.length; i++) {
+                const { folder, conversationId, targetName, targetPath } = plan.renames[i];
                 const progress = Math.round(((i + 1) / total) * 80); // 0-80% for renames
 
                 try {
-                    // Look up conversation file path from pre-built map
-                    const entry = conversationMap.get(conversationId) || null;
-
-                    if (!entry || !entry.path) {
-                        skippedCount++;
-                        details.push(`Skipped: ${conversationId} (conversation not found in vault)`);
-                        context.onProgress?.(progress, `Skipped ${i + 1}/${total}`);
-                        continue;
-                    }
-
-                    // Extract filename from path (e.g. "Nexus/Conversations/claude/2026/02/My Chat.md" → "My Chat")
-                    const pathParts = entry.path.split('/');
-                    const fileNameWithExt = pathParts[pathParts.length - 1];
-                    const conversationFileName = fileNameWithExt.replace(/\.md$/, '');
-
-                    if (!conversationFileName) {
-                        skippedCount++;
-                        details.push(`Skipped: ${conversationId} (could not determine file name)`);
-                        context.onProgress?.(progress, `Skipped ${i + 1}/${total}`);
-                        continue;
-                    }
-
-                    // Check if target folder already exists
-                    const newFolderPath = `${claudeArtifactsPath}/${conversationFileName}`;
-                    const existingTarget = context.plugin.app.vault.getAbstractFileByPath(newFolderPath);
-
-                    if (existingTarget) {
-                        skippedCount++;
-                        details.push(`Skipped: ${conversationId} → "${conversationFileName}" (target folder already exists)`);
-                        context.onProgress?.(progress, `Skipped ${i + 1}/${total}`);
-                        continue;
-                    }
-
                     // Rename the folder — vault.rename() updates internal links if Obsidian setting is enabled
                     const oldFolderPath = folder.path;
-                    context.onProgress?.(progress, `Renaming ${i + 1}/${total}: ${conversationFileName}`);
-                    await context.plugin.app.vault.rename(folder, newFolderPath);
+                    context.onProgress?.(progress, `Renaming ${i + 1}/${total}: ${targetName}`);
+                    await context.plugin.app.vault.rename(folder, targetPath);
 
-                    pathMappings.push({ oldPath: oldFolderPath, newPath: newFolderPath });
+                    pathMappings.push({ oldPath: oldFolderPath, newPath: targetPath });
                     renamedCount++;
-                    details.push(`Renamed: ${conversationId} → "${conversationFileName}"`);
+                    details.push(`Renamed: ${conversationId} → "${targetName}"`);
 
                 } catch (error) {
                     errorCount++;
@@ -231,6 +245,10 @@ class RestoreMissingArtifactCalloutsOperation extends UpgradeOperation {
     readonly description = "Restores artifact links in Claude conversation notes affected by Anthropic's export format change.";
     readonly type = "automatic" as const;
 
+    constructor(private readonly catalog: SharedConversationCatalog) {
+        super();
+    }
+
     async canRun(context: UpgradeContext): Promise<boolean> {
         try {
             const attachmentFolder = context.plugin.settings.attachmentFolder || "Nexus/Attachments";
@@ -270,10 +288,9 @@ class RestoreMissingArtifactCalloutsOperation extends UpgradeOperation {
                 return { success: true, message: "No artifact folders found." };
             }
 
-            // Build conversation lookup
+            // Reuse the conversation lookup built by the rename operation
             context.onProgress?.(0, "Scanning conversation catalog...");
-            const storageService = new StorageService(context.plugin);
-            const conversationMap = await storageService.scanExistingConversations();
+            const conversationMap = await this.catalog.get(context);
 
             const total = artifactFolders.length;
 
@@ -296,8 +313,8 @@ class RestoreMissingArtifactCalloutsOperation extends UpgradeOperation {
                     }
 
                     // Read one artifact to get conversation_id
-                    const sampleContent = await context.plugin.app.vault.read(artifactFiles[0]);
-                    const conversationId = this.extractFrontmatterField(sampleContent, 'conversation_id');
+                    const sample = await this.readArtifactRecord(context, artifactFiles[0]);
+                    const conversationId = sample.conversationId;
 
                     if (!conversationId) {
                         skippedCount++;
@@ -334,15 +351,19 @@ class RestoreMissingArtifactCalloutsOperation extends UpgradeOperation {
                         filePath: string;
                     }> = [];
 
-                    for (const artFile of artifactFiles) {
-                        const artContent = await context.plugin.app.vault.read(artFile);
-                        const artifactId = this.extractFrontmatterField(artContent, 'artifact_id') || 'unknown';
-                        const versionStr = this.extractFrontmatterField(artContent, 'version_number');
-                        const versionNumber = versionStr ? parseInt(versionStr, 10) : 1;
-                        const title = this.extractArtifactTitle(artContent, artifactId);
+                    // The sample artifact is already parsed: reuse it instead of reading the file again
+                    const records = [
+                        sample,
+                        ...await Promise.all(
+                            artifactFiles.slice(1).map(artFile => this.readArtifactRecord(context, artFile))
+                        )
+                    ];
+
+                    for (let k = 0; k < artifactFiles.length; k++) {
+                        const { artifactId, versionNumber, title } = records[k];
 
                         // Build artifact link path (without .md extension for wikilinks)
-                        const filePath = artFile.path.replace(/\.md$/, '');
+                        const filePath = artifactFiles[k].path.replace(/\.md$/, '');
 
                         artifactEntries.push({ artifactId, versionNumber, title, filePath });
                     }
@@ -400,20 +421,32 @@ class RestoreMissingArtifactCalloutsOperation extends UpgradeOperation {
         }
     }
 
-    private extractFrontmatterField(content: string, field: string): string | null {
-        const match = content.match(new RegExp(`^${field}:\\s*"?([^"\\n]+)"?`, 'm'));
-        return match ? match[1].trim() : null;
+    /**
+     * Get artifact fields from Obsidian's metadata cache (no file I/O), falling back
+     * to parsing the file's frontmatter the same way when the cache has none yet.
+     */
+    private async readArtifactRecord(context: UpgradeContext, file: TFile): Promise<ArtifactRecord> {
+        const frontmatter: Record<string, unknown> =
+            context.plugin.app.metadataCache.getFileCache(file)?.frontmatter
+            ?? parseFrontmatterLenient(await context.plugin.app.vault.read(file), ARTIFACT_SCALAR_FIELDS)
+            ?? {};
+
+        const artifactId = frontmatter.artifact_id ? String(frontmatter.artifact_id) : 'unknown';
+        return {
+            conversationId: frontmatter.conversation_id ? String(frontmatter.conversation_id) : null,
+            artifactId,
+            versionNumber: parseInt(String(frontmatter.version_number ?? ''), 10) || 1,
+            title: this.extractArtifactTitle(frontmatter.aliases, artifactId)
+        };
     }
 
-    private extractArtifactTitle(content: string, fallbackId: string): string {
-        // Try to get title from aliases array (first element is human-readable title)
-        const aliasMatch = content.match(/^aliases:\s*\[([^\]]+)\]/m);
-        if (aliasMatch) {
-            const firstAlias = aliasMatch[1].split(',')[0].trim();
-            // Remove surrounding quotes if present
-            const cleaned = firstAlias.replace(/^["']|["']$/g, '');
-            if (cleaned && cleaned !== 'Untitled Artifact') {
-                return cleaned;
+    private extractArtifactTitle(aliases: unknown, fallbackId: string): string {
+        // Try to get title from aliases (first element is human-readable title)
+        const firstAlias = Array.isArray(aliases) ? aliases[0] : aliases;
+        if (typeof firstAlias === 'string' || typeof firstAlias === 'number') {
+            const title = String(firstAlias).trim();
+            if (title && title !== 'Untitled Artifact') {
+                return title;
             }
         }
         // Fallback to artifact_id
@@ -456,52 +489,97 @@ class FixCalloutEmptyLinesOperation extends UpgradeOperation {
             const conversationFolder = context.plugin.settings.conversationFolder || "Nexus/Conversations";
 
             // Get all markdown files under the conversation folder
-            const allFiles = context.plugin.app.vault.getMarkdownFiles();
-            const conversationFiles = allFiles.filter(f => f.path.startsWith(conversationFolder));
-
-            // Pattern: ">>" on its own line followed by ">>[!nexus_"
-            const brokenPattern = /^>>$/gm;
-            const total = conversationFiles.length;
-
-            for (let i = 0; i < conversationFiles.length; i++) {
-                const file = conversationFiles[i];
-                scannedCount++;
-                const progress = Math.round(((i + 1) / total) * 100);
+            const conversationFiles = getMarkdownFilesInFolder(context.plugin.app.vault, conversationFolder);
+
+            // Skip files a previous, interrupted run already checked and that did not change since
+            const checkpoint = await loadScanCheckpoint(context.plugin, TARGET_VERSION, this.id);
+            const pendingFiles = conversationFiles.filter(f => checkpoint[f.path] !== f.stat.mtime);
+            const unchangedCount = conversationFiles.length - pendingFiles.length;
+
+            // Broken pattern: ">>" on its own line followed by ">>[!nexus_".
+            // A plain substring search screens files far faster than a multiline regex;
+            // like the fix regex below, it also matches the pattern on the first line.
+            const brokenLines = '>>\n>>[!nexus_';
+            const hasBrokenLines = (content: string) =>
+                content.startsWith(brokenLines) || content.includes(`\n${brokenLines}`);
+            const total = pendingFiles.length;
+
+            // Read ahead in batches so vault reads overlap instead of running one at a time
+            const readBatchSize = 20;
+            // Persist progress periodically so an interrupted run resumes where it stopped.
+            // Each save rewrites plugin data, so it is bounded by time, not by file count.
+            let lastCheckpointSave = Date.now();
+            for (let start = 0; start < total; start += readBatchSize) {
+                const batch = pendingFiles.slice(start, start + readBatchSize);
+
+                // cachedRead serves notes Obsidian already holds in memory without touching the disk
+                const contents = await Promise.all(batch.map(file =>
+                    context.plugin.app.vault.cachedRead(file).then(
+                        (content): { content: string } => ({ content }),
+                        (error: unknown): { error: unknown } => ({ error })
+                    )
+                ));
+
+                for (let j = 0; j < batch.length; j++) {
+                    const i = start + j;
+                    const file = batch[j];
+                    scannedCount++;
+                    const progress = Math.round(((i + 1) / total) * 100);
+
+                    // Report progress every 10 files or on last file to avoid excessive UI updates
+                    if (i % 10 === 0 || i === total - 1) {
+                        context.onProgress?.(progress, `Scanning ${i + 1}/${total}: ${file.name}`);
+                    }
 
-                // Report progress every 10 files or on last file to avoid excessive UI updates
-                if (i % 10 === 0 || i === total - 1) {
-                    context.onProgress?.(progress, `Scanning ${i + 1}/${total}: ${file.name}`);
+                    try {
+                        const cached = contents[j];
+                        if ('error' in cached) {
+                            throw cached.error;
+                        }
+
+                        // Check if this file has the broken pattern
+                        if (!hasBrokenLines(cached.content)) {
+                            checkpoint[file.path] = file.stat.mtime;
+                            continue;
+                        }
+
+                        // Re-read before modifying: the cached copy may lag behind the file on disk
+                        const content = await context.plugin.app.vault.read(file);
+
+                        // Replace ">>" empty lines with ">" — only when followed by a nexus callout
+                        let linesFixed = 0;
+                        let fixed = content.replace(/^>>(\n>>\[!nexus_)/gm, (_match, callout: string) => {
+                            linesFixed++;
+                            return `>${callout}`;
+                        });
+
+                        if (linesFixed > 0) {
+                            // Also update plugin_version in frontmatter
+                            fixed = updatePluginVersion(fixed, TARGET_VERSION);
+                            await context.plugin.app.vault.modify(file, fixed);
+                            fixedCount++;
+                            details.push(`Fixed ${linesFixed} line(s): ${file.path}`);
+                            context.onProgress?.(progress, `Fixed: ${file.name}`);
+                        }
+                        checkpoint[file.path] = file.stat.mtime;
+                    } catch (error) {
+                        errorCount++;
+                        const errorMsg = error instanceof Error ? error.message : String(error);
+                        details.push(`Error: ${file.path} — ${errorMsg}`);
+                    }
                 }
 
-                try {
-                    const content = await context.plugin.app.vault.read(file);
-
-                    // Check if this file has the broken pattern
-                    if (!brokenPattern.test(content)) {
-                        continue;
-                    }
-                    // Reset regex lastIndex after test()
-                    brokenPattern.lastIndex = 0;
-
-                    // Replace ">>" empty lines with ">" — only when followed by a nexus callout
-                    let fixed = content.replace(/^>>(\n>>\[!nexus_)/gm, '>$1');
-
-                    if (fixed !== content) {
-                        // Also update plugin_version in frontmatter
-                        fixed = updatePluginVersion(fixed, TARGET_VERSION);
-                        await context.plugin.app.vault.modify(file, fixed);
-                        fixedCount++;
-                        details.push(`Fixed: ${file.path}`);
-                        context.onProgress?.(progress, `Fixed: ${file.name}`);
-                    }
-                } catch (error) {
-                    errorCount++;
-                    const errorMsg = error instanceof Error ? error.message : String(error);
-                    details.push(`Error: ${file.path} — ${errorMsg}`);
+                if (Date.now() - lastCheckpointSave >= CHECKPOINT_SAVE_INTERVAL_MS) {
+                    await saveScanCheckpoint(context.plugin, TARGET_VERSION, this.id, checkpoint);
+                    lastCheckpointSave = Date.now();
                 }
             }
 
-            const summary = `Scanned ${scannedCount} file(s), fixed ${fixedCount}, errors ${errorCount}.`;
+            // Keep the checkpoint only if this operation will run again
+            await saveScanCheckpoint(context.plugin, TARGET_VERSION, this.id, errorCount === 0 ? null : checkpoint);
+
+            const skippedNote = unchangedCount > 0 ? `, skipped ${unchangedCount} unchanged` : '';
+            const summary = `Scanned ${scannedCount} file(s)${skippedNote}, fixed ${fixedCount}, errors ${errorCount}.`;
             return {
                 success: errorCount === 0,
                 message: summary,
@@ -524,13 +602,19 @@ class FixCalloutEmptyLinesOperation extends UpgradeOperation {
 export class Upgrade140 extends VersionUpgrade {
     readonly version = "1.4.0";
 
+    private readonly conversationCatalog = new SharedConversationCatalog();
+
     readonly automaticOperations = [
-        new RenameClaudeArtifactFoldersOperation(),
-        new RestoreMissingArtifactCalloutsOperation(),
+        new RenameClaudeArtifactFoldersOperation(this.conversationCatalog),
+        new RestoreMissingArtifactCalloutsOperation(this.conversationCatalog),
         new FixCalloutEmptyLinesOperation()
     ];
 
     readonly manualOperations = [
         // No manual operations for this version
     ];
+
+    releaseRunState(): void {
+        this.conversationCatalog.release();
+    }
 }
@@ -0,0 +1,115 @@
+import { describe, expect, it } from "vitest";
+import { parseFrontmatter, parseFrontmatterLenient, updatePluginVersion } from "./frontmatter-utils";
+
+describe("parseFrontmatter", () => {
+    it("parses typed fields and strips single and double quotes", () => {
+        const content = [
+            "---",
+            "nexus: nexus-ai-chat-importer",
+            "artifact_id: \"script\"",
+            "conversation_id: 'a3663666-58a8-4835-bef1-308fb59c8609'",
+            "version_number: 2",
+            "---",
+            "body: not frontmatter",
+        ].join("\n");
+
+        expect(parseFrontmatter(content)).toEqual({
+            nexus: "nexus-ai-chat-importer",
+            artifact_id: "script",
+            conversation_id: "a3663666-58a8-4835-bef1-308fb59c8609",
+            version_number: 2,
+        });
+    });
+
+    it("keeps alias titles containing colons, commas and quotes intact", () => {
+        expect(parseFrontmatter('---\naliases: "Plot: x, y"\n---\n')?.aliases).toBe("Plot: x, y");
+        expect(parseFrontmatter('---\naliases: ["Plot: x, y", script]\n---\n')?.aliases).toEqual(["Plot: x, y", "script"]);
+        expect(parseFrontmatter("---\naliases:\n  - 'It''s \"quoted\", ok'\n  - script\n---\n")?.aliases)
+            .toEqual(["It's \"quoted\", ok", "script"]);
+    });
+
+    it("accepts CRLF line endings and a closing fence at end of file", () => {
+        expect(parseFrontmatter("---\r\nartifact_id: script\r\n---\r\nBody")).toEqual({ artifact_id: "script" });
+        expect(parseFrontmatter("---\nartifact_id: script\n---")).toEqual({ artifact_id: "script" });
+    });
+
+    it("returns null without a frontmatter block", () => {
+        expect(parseFrontmatter("# Title\n\n---\nartifact_id: script\n---\n")).toBeNull();
+    });
+
+    it("returns null for frontmatter that is not valid YAML", () => {
+        expect(parseFrontmatter("---\ntitle: Plot: x\n---\n")).toBeNull();
+    });
+});
+
+describe("parseFrontmatterLenient", () => {
+    const keys = ["conversation_id", "artifact_id", "version_number"];
+
+    it("returns the full YAML parse when the frontmatter is valid", () => {
+        const content = '---\nconversation_id: abc\naliases: ["Plot: x, y"]\nversion_number: 2\n---\n';
+
+        expect(parseFrontmatterLenient(content, keys)).toEqual({
+            conversation_id: "abc",
+            aliases: ["Plot: x, y"],
+            version_number: 2,
+        });
+    });
+
+    it("recovers scalar fields when a malformed alias breaks the YAML", () => {
+        const content = [
+            "---",
+            "nexus: nexus-ai-chat-importer",
+            "aliases: \"It\"s broken\"",
+            "conversation_id: 'a3663666-58a8-4835-bef1-308fb59c8609'",
+            "artifact_id: \"script\"",
+            "version_number: 3",
+            "---",
+            "conversation_id: body-line",
+        ].join("\r\n");
+
+        expect(parseFrontmatter(content)).toBeNull();
+        expect(parseFrontmatterLenient(content, keys)).toEqual({
+            conversation_id: "a3663666-58a8-4835-bef1-308fb59c8609",
+            artifact_id: "script",
+            version_number: "3",
+        });
+    });
+
+    it("returns null without a frontmatter block", () => {
+        expect(parseFrontmatterLenient("conversation_id: abc\n", keys)).toBeNull();
+    });
+});
+
+describe("updatePluginVersion", () => {
+    it("replaces an existing plugin_version field", () => {
+        const content = '---\nnexus: nexus-ai-chat-importer\nplugin_version: "1.3.0"\n---\nBody';
+
+        expect(updatePluginVersion(content, "1.4.0"))
+            .toBe('---\nnexus: nexus-ai-chat-importer\nplugin_version: "1.4.0"\n---\nBody');
+    });
+
+    it("appends a missing field as the last frontmatter line, leaving body rules alone", () => {
+        const content = "---\nnexus: nexus-ai-chat-importer\n---\nIntro\n\n---\nplugin_version: body text\n";
+
+        expect(updatePluginVersion(content, "1.4.0"))
+            .toBe('---\nnexus: nexus-ai-chat-importer\nplugin_version: "1.4.0"\n---\nIntro\n\n---\nplugin_version: body text\n');
+    });
+
+    it("returns content without frontmatter unchanged", () => {
+        const content = "# Title\n\n---\nplugin_version: body text\n---\n";
+
+        expect(updatePluginVersion(content, "1.4.0")).toBe(content);
+    });
+
+    it("keeps CRLF line endings", () => {
+        expect(updatePluginVersion('---\r\nplugin_version: "1.3.0"\r\n---\r\nBody', "1.4.0"))
+            .toBe('---\r\nplugin_version: "1.4.0"\r\n---\r\nBody');
+        expect(updatePluginVersion("---\r\nnexus: x\r\n---\r\nBody", "1.4.0"))
+            .toBe('---\r\nnexus: x\r\nplugin_version: "1.4.0"\r\n---\r\nBody');
+    });
+
+    it("handles a note that is only frontmatter, closing fence at end of file", () => {
+        expect(updatePluginVersion('---\nplugin_version: "1.3.0"\n---', "1.4.0")).toBe('---\nplugin_version: "1.4.0"\n---');
+        expect(updatePluginVersion("---\nnexus: x\n---", "1.4.0")).toBe('---\nnexus: x\nplugin_version: "1.4.0"\n---');
+    });
+});
@@ -0,0 +1,108 @@
+/**
+ * Nexus AI Chat Importer - Obsidian Plugin
+ * Copyright (C) 2024 Akim Sissaoui
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+// src/utils/frontmatter-utils.ts
+import { parseYaml } from "obsidian";
+
+/**
+ * Frontmatter block anchored at the start of the note. The closing fence may be
+ * followed by a newline (LF or CRLF) or end the file.
+ *
+ * Groups: 1 = line ending of the opening fence, 2 = frontmatter content
+ */
+const FRONTMATTER_BLOCK_REGEX = /^---(\r?\n)([\s\S]*?)\r?\n---(?:\r?\n|$)/;
+
+const PLUGIN_VERSION_LINE_REGEX = /^plugin_version:.*$/m;
+
+/** Top-level "key: value" line, for frontmatter the YAML parser rejects */
+const SCALAR_LINE_REGEX = /^(\w+):[ \t]*(.*?)[ \t]*\r?$/gm;
+const QUOTED_VALUE_REGEX = /^(["'])(.*)\1$/;
+
+/**
+ * Parse a note's frontmatter with Obsidian's YAML parser, for notes the metadata
+ * cache has not indexed yet. Values come back typed exactly as in
+ * metadataCache frontmatter (quoted strings unquoted, lists as arrays).
+ *
+ * @returns null when the note has no frontmatter or it is not a valid YAML mapping
+ */
+export function parseFrontmatter(content: string): Record<string, unknown> | null {
+    const block = FRONTMATTER_BLOCK_REGEX.exec(content);
+    return block ? parseYamlMapping(block[2]) : null;
+}
+
+/**
+ * Like parseFrontmatter, but when the frontmatter is not valid YAML, recover the
+ * given scalar fields line by line instead of losing every field to one malformed
+ * value (typically a hand-edited alias). Recovered values are unquoted strings.
+ *
+ * @returns null when the note has no frontmatter
+ */
+export function parseFrontmatterLenient(content: string, scalarKeys: string[]): Record<string, unknown> | null {
+    const block = FRONTMATTER_BLOCK_REGEX.exec(content);
+    if (!block) {
+        return null;
+    }
+
+    const parsed = parseYamlMapping(block[2]);
+    if (parsed) {
+        return parsed;
+    }
+
+    const fields: Record<string, string> = {};
+    SCALAR_LINE_REGEX.lastIndex = 0;
+    let match: RegExpExecArray | null;
+    while ((match = SCALAR_LINE_REGEX.exec(block[2])) !== null) {
+        if (match[2] && scalarKeys.includes(match[1])) {
+            fields[match[1]] = match[2].replace(QUOTED_VALUE_REGEX, '$2');
+        }
+    }
+    return fields;
+}
+
+function parseYamlMapping(yaml: string): Record<string, unknown> | null {
+    try {
+        const parsed = parseYaml(yaml);
+        return parsed && typeof parsed === 'object' && !Array.isArray(parsed) ? parsed : null;
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * Set plugin_version in the note's frontmatter, replacing the existing field or
+ * appending it as the last frontmatter line. Only the frontmatter is searched, so
+ * a "plugin_version:" line in the note body is never touched.
+ *
+ * @returns the content unchanged when the note has no frontmatter
+ */
+export function updatePluginVersion(content: string, version: string): string {
+    const block = FRONTMATTER_BLOCK_REGEX.exec(content);
+    if (!block) {
+        return content;
+    }
+
+    const [, newline, frontmatter] = block;
+    const versionLine = `plugin_version: "${version}"`;
+    const updatedFrontmatter = PLUGIN_VERSION_LINE_REGEX.test(frontmatter)
+        ? frontmatter.replace(PLUGIN_VERSION_LINE_REGEX, versionLine)
+        : frontmatter ? `${frontmatter}${newline}${versionLine}` : versionLine;
+
+    const start = '---'.length + newline.length;
+    return content.substring(0, start) + updatedFrontmatter + content.substring(start + frontmatter.length);
+}
@@ -0,0 +1,83 @@
+import { describe, expect, it } from "vitest";
+import { LinkRewriter } from "./link-rewriter";
+
+const OLD_A = "Nexus/Attachments/claude/artifacts/a3663666-58a8-4835-bef1-308fb59c8609";
+const NEW_A = "Nexus/Attachments/claude/artifacts/My Chat";
+const OLD_B = "Nexus/Attachments/claude/artifacts/0f1e2d3c-4b5a-6978-8899-aabbccddeeff";
+const NEW_B = "Nexus/Attachments/claude/artifacts/Other Chat";
+
+describe("LinkRewriter", () => {
+    it("rewrites all four link forms in a single pass", () => {
+        const rewriter = new LinkRewriter([{ oldPath: OLD_A, newPath: NEW_A }]);
+        const content = [
+            `![img](${OLD_A}/chart.png)`,
+            `[doc](${OLD_A}/notes.pdf)`,
+            `![[${OLD_A}/diagram.png]]`,
+            `🎨 [[${OLD_A}/script_v1|View Artifact]]`,
+        ].join("\n");
+
+        const result = rewriter.rewrite(content);
+
+        expect(result.linksUpdated).toBe(4);
+        expect(result.content).toBe([
+            `![img](${NEW_A}/chart.png)`,
+            `[doc](${NEW_A}/notes.pdf)`,
+            `![[${NEW_A}/diagram.png]]`,
+            `🎨 [[${NEW_A}/script_v1|View Artifact]]`,
+        ].join("\n"));
+    });
+
+    it("applies several mappings without chaining replacements", () => {
+        const rewriter = new LinkRewriter([
+            { oldPath: OLD_A, newPath: OLD_B },
+            { oldPath: OLD_B, newPath: NEW_B },
+        ]);
+
+        const result = rewriter.rewrite(`[[${OLD_A}/a]] [[${OLD_B}/b]]`);
+
+        expect(result.linksUpdated).toBe(2);
+        expect(result.content).toBe(`[[${OLD_B}/a]] [[${NEW_B}/b]]`);
+    });
+
+    it("only matches mapped folders on a path boundary", () => {
+        const rewriter = new LinkRewriter([{ oldPath: "Attachments/chat", newPath: "Attachments/renamed" }]);
+        const content = "[[Attachments/chat-2/file]] [[Attachments/chat]] [[Attachments/chat/file]]";
+
+        const result = rewriter.rewrite(content);
+
+        expect(result.linksUpdated).toBe(1);
+        expect(result.content).toBe("[[Attachments/chat-2/file]] [[Attachments/chat]] [[Attachments/renamed/file]]");
+    });
+
+    it("prefers the longest mapped prefix and ignores trailing slashes", () => {
+        const rewriter = new LinkRewriter([
+            { oldPath: "A/", newPath: "X/" },
+            { oldPath: "A/b", newPath: "Y" },
+        ]);
+
+        const result = rewriter.rewrite("[[A/b/c]] [[A/d]]");
+
+        expect(result.content).toBe("[[Y/c]] [[X/d]]");
+        expect(result.linksUpdated).toBe(2);
+    });
+
+    it("leaves content untouched when no link matches", () => {
+        const rewriter = new LinkRewriter([{ oldPath: OLD_A, newPath: NEW_A }]);
+        const content = `Plain text mentioning ${OLD_A}/file without a link [[Other/file]]`;
+
+        const result = rewriter.rewrite(content);
+
+        expect(result.linksUpdated).toBe(0);
+        expect(result.content).toBe(content);
+    });
+
+    it("screens out content that cannot reference any mapped folder", () => {
+        const rewriter = new LinkRewriter([
+            { oldPath: OLD_A, newPath: NEW_A },
+            { oldPath: OLD_B, newPath: NEW_B },
+        ]);
+
+        expect(rewriter.mayRewrite("[[Nexus/Conversations/claude/2026/02/Chat]]")).toBe(false);
+        expect(rewriter.mayRewrite(`[[${OLD_B}/file]]`)).toBe(true);
+    });
+});
@@ -0,0 +1,123 @@
+/**
+ * Nexus AI Chat Importer - Obsidian Plugin
+ * Copyright (C) 2024 Akim Sissaoui
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+// src/utils/link-rewriter.ts
+
+export interface PathMapping {
+    oldPath: string;
+    newPath: string;
+}
+
+export interface LinkRewriteResult {
+    content: string;
+    linksUpdated: number;
+}
+
+/**
+ * Matches every link form we rewrite, in one scan:
+ * - Markdown links/images: [text](target) / ![alt](target)
+ * - Obsidian links/embeds: [[target]] / ![[target]]
+ *
+ * Groups: 1 = markdown prefix, 2 = markdown target, 3 = wikilink prefix, 4 = wikilink target
+ */
+const LINK_PATTERN = /(!?\[[^\]]*\]\()([^)]+)\)|(!?\[\[)([^\]]+)\]\]/g;
+
+/**
+ * Rewrites folder prefixes in links for many old→new path mappings at once.
+ *
+ * Each file is scanned a single time: every link target is matched once and its
+ * folder prefixes are looked up in a Map, instead of running one regex per
+ * mapping over the whole content.
+ */
+export class LinkRewriter {
+    private readonly mappings = new Map<string, string>();
+    /** Parent folders of all old paths, used as a cheap substring screen */
+    private readonly parentFolders = new Set<string>();
+
+    constructor(pathMappings: PathMapping[]) {
+        for (const { oldPath, newPath } of pathMappings) {
+            const normalizedOld = oldPath.replace(/\/+$/, '');
+            if (!normalizedOld || this.mappings.has(normalizedOld)) continue;
+            this.mappings.set(normalizedOld, newPath.replace(/\/+$/, ''));
+
+            const slash = normalizedOld.lastIndexOf('/');
+            this.parentFolders.add(slash > 0 ? normalizedOld.substring(0, slash + 1) : normalizedOld);
+        }
+    }
+
+    /**
+     * Quick screen: false when the content cannot contain any mapped link.
+     * Mapped folders usually share one parent (e.g. claude/artifacts/), so this is
+     * typically a single substring search instead of a full link scan.
+     */
+    mayRewrite(content: string): boolean {
+        for (const parent of this.parentFolders) {
+            if (content.includes(parent)) return true;
+        }
+        return false;
+    }
+
+    /**
+     * Replace mapped folder prefixes in all links of the content.
+     */
+    rewrite(content: string): LinkRewriteResult {
+        if (this.mappings.size === 0 || !this.mayRewrite(content)) {
+            return { content, linksUpdated: 0 };
+        }
+
+        let linksUpdated = 0;
+        LINK_PATTERN.lastIndex = 0;
+        const updated = content.replace(
+            LINK_PATTERN,
+            (match: string, mdPrefix?: string, mdTarget?: string, wikiPrefix?: string, wikiTarget?: string) => {
+                const target = mdTarget ?? wikiTarget ?? '';
+                const newTarget = this.rewriteTarget(target);
+                if (newTarget === null) {
+                    return match;
+                }
+
+                linksUpdated++;
+                return mdPrefix !== undefined
+                    ? `${mdPrefix}${newTarget})`
+                    : `${wikiPrefix}${newTarget}]]`;
+            }
+        );
+
+        return { content: updated, linksUpdated };
+    }
+
+    /**
+     * Return the target with its longest mapped folder prefix replaced,
+     * or null when no mapping applies. A prefix only matches on a "/" boundary
+     * with at least one character after it.
+     */
+    private rewriteTarget(target: string): string | null {
+        let slash = target.lastIndexOf('/');
+        while (slash > 0) {
+            if (slash < target.length - 1) {
+                const newPrefix = this.mappings.get(target.substring(0, slash));
+                if (newPrefix !== undefined) {
+                    return newPrefix + target.substring(slash);
+                }
+            }
+            slash = target.lastIndexOf('/', slash - 1);
+        }
+        return null;
+    }
+}
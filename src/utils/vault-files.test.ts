@@ -0,0 +1,101 @@
+import { describe, expect, it } from "vitest";
+import { TAbstractFile, TFile, TFolder, Vault } from "obsidian";
+import { getConversationNoteFiles, getMarkdownFilesInFolder } from "./vault-files";
+
+function file(path: string): TFile {
+    const f = new TFile();
+    f.path = path;
+    f.name = path.split("/").pop() || path;
+    f.extension = f.name.split(".").pop() || "";
+    return f;
+}
+
+function folder(path: string, children: TAbstractFile[]): TFolder {
+    const f = new TFolder();
+    f.path = path;
+    f.name = path.split("/").pop() || path;
+    f.children = children;
+    children.forEach(child => { child.parent = f; });
+    return f;
+}
+
+function vaultWith(...folders: TFolder[]): Vault {
+    const vault = new Vault();
+    vault.getAbstractFileByPath = (path: string) => folders.find(f => f.path === path) ?? null;
+    return vault;
+}
+
+describe("getMarkdownFilesInFolder", () => {
+    const reports = folder("Nexus/Conversations/Reports", [file("Nexus/Conversations/Reports/report.md")]);
+    const month = folder("Nexus/Conversations/claude/2026/02", [
+        file("Nexus/Conversations/claude/2026/02/Chat.md"),
+        file("Nexus/Conversations/claude/2026/02/image.png"),
+    ]);
+    const root = folder("Nexus/Conversations", [
+        file("Nexus/Conversations/Top.md"),
+        reports,
+        folder("Nexus/Conversations/claude", [folder("Nexus/Conversations/claude/2026", [month])]),
+    ]);
+
+    it("collects markdown files from the whole subtree", () => {
+        const paths = getMarkdownFilesInFolder(vaultWith(root), "Nexus/Conversations/").map(f => f.path).sort();
+
+        expect(paths).toEqual([
+            "Nexus/Conversations/Reports/report.md",
+            "Nexus/Conversations/Top.md",
+            "Nexus/Conversations/claude/2026/02/Chat.md",
+        ]);
+    });
+
+    it("does not descend into skipped folders", () => {
+        const paths = getMarkdownFilesInFolder(vaultWith(root), "Nexus/Conversations", f => f.name === "Reports")
+            .map(f => f.path);
+
+        expect(paths).not.toContain("Nexus/Conversations/Reports/report.md");
+        expect(paths).toHaveLength(2);
+    });
+
+    it("returns an empty list when the folder does not exist", () => {
+        expect(getMarkdownFilesInFolder(vaultWith(root), "Nexus/Missing")).toEqual([]);
+    });
+
+    it("lists files in a stable order: folder files first, then subfolders in child order", () => {
+        const tree = folder("Root", [
+            folder("Root/a", [file("Root/a/1.md"), folder("Root/a/deep", [file("Root/a/deep/2.md")])]),
+            file("Root/top.md"),
+            folder("Root/b", [file("Root/b/3.md")]),
+        ]);
+
+        expect(getMarkdownFilesInFolder(vaultWith(tree), "Root").map(f => f.path)).toEqual([
+            "Root/top.md",
+            "Root/a/1.md",
+            "Root/a/deep/2.md",
+            "Root/b/3.md",
+        ]);
+    });
+});
+
+describe("getConversationNoteFiles", () => {
+    const conversations = folder("Nexus/Conversations", [
+        folder("Nexus/Conversations/Reports", [file("Nexus/Conversations/Reports/report.md")]),
+        folder("Nexus/Conversations/attachments", [file("Nexus/Conversations/attachments/note.md")]),
+        folder("Nexus/Conversations/claude", [
+            file("Nexus/Conversations/claude/Chat.md"),
+            folder("Nexus/Conversations/claude/Reports", [file("Nexus/Conversations/claude/Reports/Named.md")]),
+        ]),
+    ]);
+
+    it("skips Reports and Attachments directly under the conversation folder only", () => {
+        expect(getConversationNoteFiles(vaultWith(conversations), "Nexus/Conversations").map(f => f.path)).toEqual([
+            "Nexus/Conversations/claude/Chat.md",
+            "Nexus/Conversations/claude/Reports/Named.md",
+        ]);
+    });
+
+    it("normalizes a trailing slash in the folder setting", () => {
+        expect(getConversationNoteFiles(vaultWith(conversations), "Nexus/Conversations/").map(f => f.path)).toEqual([
+            "Nexus/Conversations/claude/Chat.md",
+            "Nexus/Conversations/claude/Reports/Named.md",
+        ]);
+    });
+});
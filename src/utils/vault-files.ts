@@ -0,0 +1,78 @@
+/**
+ * Nexus AI Chat Importer - Obsidian Plugin
+ * Copyright (C) 2024 Akim Sissaoui
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+// src/utils/vault-files.ts
+import { TFile, TFolder, Vault } from "obsidian";
+
+/**
+ * Collect markdown files under a folder by walking only that subtree.
+ *
+ * Cheaper than filtering vault.getMarkdownFiles() by path prefix: files outside the
+ * folder are never visited, and a prefix like "Nexus/Conversations" can no longer
+ * match a sibling such as "Nexus/Conversations-old".
+ *
+ * Files come in a stable order: each folder's files in child order, then its
+ * subfolders depth-first in child order.
+ *
+ * @param skipFolder - Return true to skip a subfolder without descending into it
+ */
+export function getMarkdownFilesInFolder(
+    vault: Vault,
+    folderPath: string,
+    skipFolder?: (folder: TFolder) => boolean
+): TFile[] {
+    const root = vault.getAbstractFileByPath(folderPath.replace(/\/+$/, ''));
+    if (!(root instanceof TFolder)) {
+        return [];
+    }
+
+    const files: TFile[] = [];
+    const pending: TFolder[] = [root];
+    while (pending.length > 0) {
+        const folder = pending.pop()!;
+        const subfolders: TFolder[] = [];
+        for (const child of folder.children) {
+            if (child instanceof TFolder) {
+                if (!skipFolder?.(child)) {
+                    subfolders.push(child);
+                }
+            } else if (child instanceof TFile && child.extension === 'md') {
+                files.push(child);
+            }
+        }
+        // Pushed in reverse so the first subfolder is walked next
+        for (let i = subfolders.length - 1; i >= 0; i--) {
+            pending.push(subfolders[i]);
+        }
+    }
+
+    return files;
+}
+
+/**
+ * Collect conversation notes: markdown files under the conversation folder,
+ * excluding the Reports and Attachments folders directly under it.
+ */
+export function getConversationNoteFiles(vault: Vault, conversationFolder: string): TFile[] {
+    const rootPath = conversationFolder.replace(/\/+$/, '');
+    return getMarkdownFilesInFolder(vault, rootPath, folder =>
+        folder.parent?.path === rootPath &&
+        ['reports', 'attachments'].includes(folder.name.toLowerCase())
+    );
+}